@@ -2,7 +2,7 @@ import os
 from pathlib import Path
 
 from joblib import Parallel, delayed
-from typing_extensions import Callable, Iterable, TypeVar, cast
+from typing_extensions import Callable, Iterable, Iterator, TypeVar, cast
 
 PROJECT_ROOT = Path(os.path.realpath(__file__)).parents[2]
 
@@ -13,3 +13,11 @@ R = TypeVar("R")
 def parallelize(func: Callable[[T], R], X: Iterable[T]) -> list[R]:
     # Use a list comprehension to avoid generator-related Unknown types and cast the result
     return cast(list[R], Parallel(n_jobs=-1)([delayed(func)(x) for x in X]))
+
+
+def parallelize_iter(func: Callable[[T], R], X: Iterable[T]) -> Iterator[R]:
+    # Like parallelize, but yield results in order as they finish instead of collecting them into a list
+    return cast(
+        Iterator[R],
+        Parallel(n_jobs=-1, return_as="generator")(delayed(func)(x) for x in X),
+    )
@@ -191,6 +191,18 @@ def levenshtein_distance(s1: str, s2: str) -> int:
         s1, s2 = s2, s1
     assert len(s1) >= len(s2)
 
+    # A common prefix or suffix never changes the distance, and similar domains
+    # usually share a lot of both (e.g. "goggle.com" and "google.com"),
+    # so strip them to shrink the distance matrix
+    start = 0
+    while start < len(s2) and s1[start] == s2[start]:
+        start += 1
+    end = 0
+    while end < len(s2) - start and s1[-1 - end] == s2[-1 - end]:
+        end += 1
+    s1 = s1[start : len(s1) - end]
+    s2 = s2[start : len(s2) - end]
+
     # Optimization for trivial case
     if len(s2) == 0:
         return len(s1)
@@ -15,6 +15,7 @@ Libraries used:
 
 import urllib.parse
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
 from tldextract import extract
 
@@ -22,7 +23,7 @@ Url = urllib.parse.ParseResult
 """A parsed URL in lowercase."""
 
 
-@dataclass()
+@dataclass(frozen=True)
 class Domain:
     """
     A parsed domain name with its component parts.
@@ -42,7 +43,10 @@ class Domain:
     domain_name: str
     tld: str
 
-    @property
+    # Domains are frozen and shared through the parse_netloc cache, so the host is
+    # only built once per netloc. Comparing or hashing the same host string again
+    # is then a pointer comparison or a cached hash instead of a new string.
+    @cached_property
     def host(self) -> str:
         """
         Return the host (domain + tld) of the domain.
@@ -85,7 +89,28 @@ def parse_domain(url: Url) -> Domain:
         >>> print(domain.tld)
         'com'
     """
-    domain_parts = extract(url.netloc)
+    return parse_netloc(url.netloc)
+
+
+# The same hosts appear in many emails, and looking them up in the public
+# suffix list is much slower than a cache hit. Domain is frozen, so the cached
+# instances can safely be shared.
+@lru_cache(maxsize=8192)
+def parse_netloc(netloc: str) -> Domain:
+    """
+    Parse the network location of a URL into its domain components.
+
+    Args:
+        netloc: The network location part of a URL (e.g., 'www.example.com')
+
+    Returns:
+        Domain: A Domain object containing the parsed components
+
+    Example:
+        >>> parse_netloc("a.b.example.co.uk").host
+        'example.co.uk'
+    """
+    domain_parts = extract(netloc)
     return Domain(
         subdomain=domain_parts.subdomain,
         domain_name=domain_parts.domain,
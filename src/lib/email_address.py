@@ -13,12 +13,13 @@ components that can be analyzed.
 import re
 from dataclasses import dataclass
 from email.utils import parseaddr
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from .domain import Domain, parse_domain
 
 
-@dataclass()
+@dataclass(frozen=True)
 class EmailAddress:
     """
     A parsed email address prepared for feature extraction.
@@ -43,6 +44,9 @@ class EmailAddress:
 ADDRESS_PATTERN = re.compile(r"(([^@+]*)\+)?([^@]+)@([^@]+)")
 
 
+# The same senders and recipients appear in many emails. EmailAddress is frozen,
+# so the cached instances can safely be shared.
+@lru_cache(maxsize=8192)
 def parse_email_address(address: str) -> EmailAddress:
     """
     Parse an email address into its component parts.
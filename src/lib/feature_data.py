@@ -55,11 +55,11 @@ def load_lines_as_set(filepath: str, lower: bool) -> set[str]:
         ['blue', 'green', 'red']
     """
     with open(filepath, "r") as f:
-        return {
-            stripped.lower() if lower else stripped
-            for line in f.readlines()
-            if (stripped := line.strip())
-        }
+        content = f.read()
+    # Lowercase the whole file at once instead of every line separately
+    if lower:
+        content = content.lower()
+    return {stripped for line in content.split("\n") if (stripped := line.strip())}
 
 
 def load_top_domains() -> set[str]:  # pragma: no cover
@@ -4,7 +4,7 @@ Feature extraction module for phishing detection by a machine learning model.
 
 import re
 from functools import lru_cache
-from ipaddress import ip_address
+from socket import AF_INET, AF_INET6, inet_pton
 
 from typing_extensions import Callable, Iterable, Iterator
 
@@ -259,12 +259,25 @@ def is_ip_address(url: Url) -> bool:
         >>> is_ip_address(urlparse("http://2001:db8::1/path"))  # IPv6
         True
     """
-    if url.hostname is None:
+    host = url.hostname
+    if host is None:
         return False
+    # inet_pton parses addresses in C, which is much faster than ipaddress.ip_address.
+    # It raises OSError for invalid addresses, and ValueError for null bytes.
     try:
-        _ = ip_address(url.hostname)
+        inet_pton(AF_INET, host)
         return True
-    except ValueError:
+    except (OSError, ValueError):
+        pass
+    # inet_pton doesn't accept IPv6 zone IDs (e.g. "fe80::1%eth0"),
+    # so validate and remove them the same way ipaddress.ip_address does
+    address, separator, zone_id = host.partition("%")
+    if "/" in host or (separator and (not zone_id or "%" in zone_id)):
+        return False
+    try:
+        inet_pton(AF_INET6, address)
+        return True
+    except (OSError, ValueError):
         return False
 
 
@@ -337,10 +350,8 @@ def email_domain_matches_url(
         # If there are no URLs, we cannot match the sender's domain to any URL domain,
         # but we return True to mark it as safe as phishing emails usually contain URLs.
         return True
-    for domain in url_domains:
-        if email_address.domain.host == domain.host:
-            return True
-    return False
+    sender_host = email_address.domain.host
+    return any(domain.host == sender_host for domain in url_domains)
 
 
 def capital_words_ratio(words: list[str]) -> float:
@@ -366,15 +377,18 @@ def capital_words_ratio(words: list[str]) -> float:
         >>> capital_words_ratio(["ALL", "CAPS", "TEXT", "HERE"])
         1.0
     """
+    # isupper() stops at the first lowercase letter, while isalpha() has to scan
+    # every letter of the (usually lowercase) word, so check isupper() first
     return sum(
         1  # This comment is to force the formatter to keep this on multiple lines
         for word in words
-        if word.isalpha() and word.isupper()
+        if word.isupper() and word.isalpha()
     ) / max(1, len(words))
 
 
 # Define this outside the function to avoid recompiling the regex on each call.
-MONEY_PATTERN = re.compile(r"[$€£]\d+")
+# Only a match is needed, so stop after the first digit instead of matching all of them.
+MONEY_PATTERN = re.compile(r"[$€£]\d")
 
 
 def money_tokens_ratio(tokens: list[str]) -> float:
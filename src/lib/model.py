@@ -31,12 +31,16 @@ import os
 from enum import Enum
 
 import joblib
+import numpy as np
+from numpy.typing import NDArray
+from sklearn.calibration import CalibratedClassifierCV
 from sklearn.compose import ColumnTransformer
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
-from sklearn.svm import SVC
+from sklearn.svm import SVC, LinearSVC
+from typing_extensions import Iterable, Sequence
 
 from . import PROJECT_ROOT
 from .dataset import Label
@@ -57,7 +61,8 @@ from .feature_extract import (
 MODELS_PATH = os.path.join(
     PROJECT_ROOT, "models"
 )  # Path to the directory containing trained model files
-Model = RandomForestClassifier | SVC  # Type alias for supported model types
+# Type alias for supported model types, SVC is only used by older SVM models
+Model = RandomForestClassifier | CalibratedClassifierCV | SVC
 
 
 class ModelType(Enum):
@@ -153,7 +158,8 @@ class PhisherCop:
 
         Args:
             pipeline: A scikit-learn Pipeline that transforms raw features into model inputs
-            model: A trained classifier model (RandomForestClassifier or SVC)
+            model: A trained classifier model (RandomForestClassifier, or
+                   CalibratedClassifierCV/SVC for SVM models)
 
         Raises:
             ValueError: If the model type is not supported
@@ -186,7 +192,7 @@ class PhisherCop:
         match model:
             case RandomForestClassifier():
                 self.model_type = ModelType.RANDOM_FOREST
-            case SVC():
+            case CalibratedClassifierCV() | SVC():
                 self.model_type = ModelType.SVM
             case _:
                 raise ValueError("Unsupported model type")
@@ -309,9 +315,80 @@ class PhisherCop:
             >>> print(f"Suspicious email is {'suspicious' if suspicious_score > 0.5 else 'safe'}")
         """
         preprocessed_email = preprocess_email(email, ignore_errors=False)
-        features = extract_features(self.model_type, preprocessed_email)
-        features = self.pipeline.transform([features])
-        return self.model.predict_proba(features)[0, Label.SPAM.value].item()  # type: ignore
+        return self.score_preprocessed_email(preprocessed_email)
+
+    def score_preprocessed_email(self, email: PreprocessedEmail) -> float:
+        """
+        Predict the probability that an already preprocessed email is a phishing attempt.
+
+        Preprocessing does not depend on the model, so this lets callers reuse
+        a PreprocessedEmail instead of parsing the same email again.
+
+        Args:
+            email: A PreprocessedEmail to be scored
+
+        Returns:
+            float: Phishing score between 0.0 and 1.0, where:
+                  - 1.0 means definitely spam/phishing
+                  - 0.0 means definitely ham/legitimate
+        """
+        return self.score_preprocessed_emails([email])[0].item()
+
+    def score_emails(self, emails: Sequence[Email]) -> NDArray[np.float64]:
+        """
+        Predict the probability that each of several emails is a phishing attempt.
+
+        Scoring emails one by one with `score_email` pays the per-call overhead
+        of the preprocessor and the model for every email. This scores all of
+        them with a single call to each instead.
+
+        Args:
+            emails: The Email objects to be scored
+
+        Returns:
+            NDArray: Phishing scores between 0.0 and 1.0, one for each email
+
+        Raises:
+            ValueError: If `emails` is empty
+
+        Example:
+            >>> from lib.email import email_from_input
+            >>> model = PhisherCop.load("models/svm.joblib")
+            >>> emails = [
+            ...     email_from_input("friend@gmail.com", "Lunch", "See you tomorrow!", ""),
+            ...     email_from_input("bank@secure-login.com", "URGENT", "Verify now", ""),
+            ... ]
+            >>> model.score_emails(emails).shape
+            (2,)
+        """
+        preprocessed_emails = [
+            preprocess_email(email, ignore_errors=False) for email in emails
+        ]
+        return self.score_preprocessed_emails(preprocessed_emails)
+
+    def score_preprocessed_emails(
+        self, emails: Sequence[PreprocessedEmail]
+    ) -> NDArray[np.float64]:
+        """
+        Predict the probability that each of several preprocessed emails is a phishing attempt.
+
+        Args:
+            emails: The PreprocessedEmails to be scored
+
+        Returns:
+            NDArray: Phishing scores between 0.0 and 1.0, one for each email
+
+        Raises:
+            ValueError: If `emails` is empty
+        """
+        features = self.pipeline.transform(
+            feature_matrix(
+                self.model_type,
+                (extract_features(self.model_type, email) for email in emails),
+                len(emails),
+            )
+        )
+        return self.model.predict_proba(features)[:, Label.SPAM.value]  # type: ignore
 
 
 def create_preprocessor(model_type: ModelType) -> Pipeline:
@@ -380,15 +457,16 @@ def create_model(model_type: ModelType, seed: int) -> Model:
 
     Example:
         >>> from sklearn.ensemble import RandomForestClassifier
-        >>> from sklearn.svm import SVC
+        >>> from sklearn.calibration import CalibratedClassifierCV
         >>> rf_model = create_model(ModelType.RANDOM_FOREST, 42)
         >>> isinstance(rf_model, RandomForestClassifier)
         True
         >>> svm_model = create_model(ModelType.SVM, 42)
-        >>> isinstance(svm_model, SVC)
-        True
-        >>> svm_model.probability  # SVM configured to output probabilities
+        >>> isinstance(svm_model, CalibratedClassifierCV)  # Outputs probabilities
         True
+        >>> svm_model.estimator
+        LinearSVC(C=0.02, intercept_scaling=10, loss='hinge', max_iter=100000,
+                  random_state=42)
     """
     match model_type:
         case ModelType.RANDOM_FOREST:
@@ -400,11 +478,25 @@ def create_model(model_type: ModelType, seed: int) -> Model:
                 n_jobs=-1,
             )
         case ModelType.SVM:
-            return SVC(
-                random_state=seed,
-                kernel="linear",
-                C=0.02,
-                probability=True,
+            # LinearSVC (liblinear) trains much faster than SVC(kernel="linear") (libsvm).
+            # To keep the same objective, it uses the hinge loss instead of its default
+            # squared hinge loss, and a large intercept_scaling so the intercept is barely
+            # regularized (libsvm does not regularize it at all). That way C keeps its old meaning.
+            # LinearSVC has no predict_proba, so its decision function is calibrated
+            # into probabilities with cross-validated Platt scaling. Like
+            # SVC(probability=True), the final classifier is fit on all training data
+            # (ensemble=False), but the calibration folds are not identical to libsvm's.
+            return CalibratedClassifierCV(
+                LinearSVC(
+                    C=0.02,
+                    loss="hinge",
+                    intercept_scaling=10,
+                    max_iter=100_000,
+                    random_state=seed,
+                ),
+                method="sigmoid",
+                ensemble=False,
+                n_jobs=-1,
             )
 
 
@@ -469,3 +561,60 @@ def extract_features(
         return common_features
     # TF-IDF requires extra "words" feature
     return [" ".join(email.words)] + common_features
+
+
+def feature_matrix(
+    model_type: ModelType,
+    features: Iterable[list[float | str]],
+    count: int,
+) -> NDArray[np.float64 | np.object_]:
+    """
+    Stack feature vectors from `extract_features` into a 2D array for the preprocessor.
+
+    The array is allocated once and filled one feature vector at a time, so
+    `features` can be a generator and the vectors never need to be collected
+    into a list first.
+
+    Feature vectors of TF-IDF models mix text and numbers, so they are stored
+    in an object array. Passing a plain list to the preprocessor would make
+    NumPy convert it into a fixed-width string array, padding every single
+    feature to the length of the longest email text.
+
+    Args:
+        model_type: The type of model the features were extracted for
+        features: Feature vectors, one for each email
+        count: The number of feature vectors in `features`
+
+    Returns:
+        NDArray: A 2D array with one row per email
+
+    Raises:
+        ValueError: If `count` is zero or `features` doesn't have exactly `count` vectors
+
+    Example:
+        >>> feature_matrix(ModelType.SVM, [[1.0, 2.0], [3.0, 4.0]], 2).dtype
+        dtype('float64')
+        >>> feature_matrix(ModelType.RANDOM_FOREST, [["hello world", 1.0]], 1).dtype
+        dtype('O')
+        >>> feature_matrix(ModelType.SVM, [], 0)
+        Traceback (most recent call last):
+        ...
+        ValueError: No feature vectors to stack
+    """
+    if count <= 0:
+        raise ValueError("No feature vectors to stack")
+
+    dtype = object if model_type.uses_tfidf else np.float64
+    matrix = np.empty((count, 0), dtype=dtype)
+    rows = 0
+    for i, row in enumerate(features):
+        if i >= count:
+            raise ValueError(f"Expected {count} feature vectors, got more")
+        # The number of features is only known once the first vector arrives
+        if i == 0:
+            matrix = np.empty((count, len(row)), dtype=dtype)
+        matrix[i] = row
+        rows = i + 1
+    if rows != count:
+        raise ValueError(f"Expected {count} feature vectors, got {rows}")
+    return matrix
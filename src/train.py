@@ -27,15 +27,17 @@ Example:
 """
 
 import os
+from collections import Counter
 from functools import partial
+from itertools import batched
 
 import numpy as np
 from numpy.typing import NDArray
 from sklearn.metrics import confusion_matrix, f1_score
 
-from lib import parallelize
+from lib import parallelize, parallelize_iter
 from lib.dataset import Label, load_data
-from lib.email import preprocess_email
+from lib.email import Email, preprocess_email
 from lib.feature_data import SUSPICIOUS_WORDS
 from lib.model import (
     ModelType,
@@ -43,6 +45,7 @@ from lib.model import (
     create_model,
     create_preprocessor,
     extract_features,
+    feature_matrix,
 )
 
 # Configuration constants
@@ -53,6 +56,24 @@ MODEL_TYPE = ModelType.RANDOM_FOREST  # The type of model to train
 MODEL_SEED = 69420  # Random seed for reproducible results
 
 
+def preprocess_and_extract(model_type: ModelType, email: Email) -> list[float | str]:
+    """
+    Preprocess an email and extract its features for the given model type.
+
+    Doing both steps in one function lets them run in a single parallel pass,
+    so each email is only sent to a worker process once and the intermediate
+    PreprocessedEmail never has to be sent back.
+
+    Args:
+        model_type: The type of model for which features are being extracted
+        email: The raw email to preprocess
+
+    Returns:
+        list: The feature vector of the email
+    """
+    return extract_features(model_type, preprocess_email(email))
+
+
 def top_n(word_counts: dict[str, int], n: int) -> dict[str, int]:
     """
     Return the top N words by frequency count from a word count dictionary.
@@ -70,12 +91,58 @@ def top_n(word_counts: dict[str, int], n: int) -> dict[str, int]:
         >>> sorted(result.items())
         [('cherry', 15), ('apple', 10)]
     """
-    descending = sorted(
-        word_counts.items(),
-        key=lambda kv: kv[1],
-        reverse=True,
-    )
-    return {k: v for k, v in descending[:n]}
+    # most_common(n) uses a heap, so it avoids sorting every word when n is small
+    return dict(Counter(word_counts).most_common(n))
+
+
+def count_words(email_words: tuple[list[str], ...]) -> Counter[str]:
+    """
+    Count the lowercase alphabetic words in a batch of emails.
+
+    Args:
+        email_words: Batch of word lists, one for each email
+
+    Returns:
+        Counter mapping each lowercase alphabetic word to its frequency count
+
+    Example:
+        >>> count_words((["Hello", "hello", "$100"], ["world"]))
+        Counter({'hello': 2, 'world': 1})
+    """
+    # Counter.update counts in C, so the normalization below only runs
+    # once per distinct word instead of once per occurrence
+    raw_word_counts: Counter[str] = Counter()
+    for words in email_words:
+        raw_word_counts.update(words)
+
+    # The words come from words_from_tokens, which only yields non-empty [a-z0-9]+
+    # runs, so they never contain whitespace and don't need to be stripped.
+    # isalpha() then also rejects any empty word, so no extra check is needed
+    word_counts: Counter[str] = Counter()
+    for word, count in raw_word_counts.items():
+        word = word.lower()
+        if word.isalpha():
+            word_counts[word] += count
+    return word_counts
+
+
+def count_words_parallel(email_words: list[list[str]]) -> Counter[str]:
+    """
+    Count the lowercase alphabetic words of all emails, using all CPU cores.
+
+    The emails are split into one batch per core, each batch is counted
+    in a separate process, and the partial counts are merged at the end.
+
+    Args:
+        email_words: List of word lists for each email
+
+    Returns:
+        Counter mapping each lowercase alphabetic word to its frequency count
+    """
+    # Ceiling division so that there are at most cpu_count() batches
+    batch_size = max(1, -(-len(email_words) // (os.cpu_count() or 1)))
+    partial_counts = parallelize(count_words, batched(email_words, batch_size))
+    return sum(partial_counts, Counter())
 
 
 def generate_suspicious_words(
@@ -108,29 +175,24 @@ def generate_suspicious_words(
         >>> labels = array([Label.HAM.value, Label.SPAM.value], dtype=np.uint8)
         >>> generate_suspicious_words(words, labels)
         Generating suspicious keyword list...
-        Generated 2 suspicious keywords.
-        # Creates file with 'urgent' and 'bitcoin' as suspicious words
+        Generated 4 suspicious keywords.
+        # Creates file with 'bitcoin', 'money', 'transfer' and 'urgent' as suspicious words
     """
     print("Generating suspicious keyword list...")
 
-    ham_word_counts = {}
-    spam_word_counts = {}
-    for words, label in zip(email_words, labels):
-        word_counts = ham_word_counts if label == Label.HAM else spam_word_counts
-        for word in words:
-            word = word.lower().strip()
-            if not word or not word.isalpha():
-                continue
-            word_counts[word] = word_counts.get(word, 0) + 1
+    ham_word_counts, spam_word_counts = (
+        count_words_parallel(
+            [words for words, label in zip(email_words, labels) if label == value]
+        )
+        for value in (Label.HAM.value, Label.SPAM.value)
+    )
 
     # Remove common "ham" words from "spam" words
     ham = top_n(ham_word_counts, 80)
     spam = top_n(spam_word_counts, 80)
-    for word in ham.keys():
-        if word in spam:
-            del spam[word]
+    spam_only_words = spam.keys() - ham.keys()
 
-    sus_words = {word for word in spam.keys() if len(word) >= 4}
+    sus_words = {word for word in spam_only_words if len(word) >= 4}
     print(f"Generated {len(sus_words)} suspicious keywords.")
     with open(SUSPICIOUS_WORDS, "w") as f:
         for word in sorted(sus_words):
@@ -143,32 +205,46 @@ if __name__ == "__main__":
     for X, name in zip((train_X, test_X), ("Train", "Test")):
         print(f"{name} set: {len(X)} samples")
 
-    # Step 2: Preprocess the emails in parallel for better performance
-    train_X, test_X = (parallelize(preprocess_email, X) for X in (train_X, test_X))
-
-    # Step 3: Generate suspicious words list if needed
+    # Step 2: Generate suspicious words list if needed
+    # This is the only step that needs the preprocessed emails on their own,
+    # so they are only kept around when the list has to be regenerated.
     if FORCE_REGENERATE_SUSPICIOUS_WORDS or not os.path.exists(SUSPICIOUS_WORDS):
-        generate_suspicious_words([email.words for email in train_X], train_y)
+        generate_suspicious_words(
+            [email.words for email in parallelize(preprocess_email, train_X)],
+            train_y,
+        )
 
-    # Step 4: Extract features from preprocessed emails
+    # Step 3: Preprocess the emails and extract their features in a single parallel pass
+    # Feature vectors are written straight into the matrix as the workers finish them
     train_X, test_X = (
-        parallelize(partial(extract_features, MODEL_TYPE), X) for X in (train_X, test_X)
+        feature_matrix(
+            MODEL_TYPE,
+            parallelize_iter(partial(preprocess_and_extract, MODEL_TYPE), X),
+            len(X),
+        )
+        for X in (train_X, test_X)
     )
 
-    # Step 5: Create and fit the preprocessor pipeline
+    # Step 4: Create and fit the preprocessor pipeline
     preprocessor = create_preprocessor(MODEL_TYPE)
     train_X = preprocessor.fit_transform(train_X)
     test_X = preprocessor.transform(test_X)
-
-    # Step 6: Create and train the model
+    if MODEL_TYPE == ModelType.RANDOM_FOREST:
+        # Random forests convert their inputs to float32 anyway, so casting once
+        # here halves the memory of the inputs. Other models (like LinearSVC)
+        # validate their inputs as float64, and a cast would only force a copy back.
+        train_X = train_X.astype(np.float32, copy=False)
+        test_X = test_X.astype(np.float32, copy=False)
+
+    # Step 5: Create and train the model
     model = create_model(MODEL_TYPE, MODEL_SEED)
     model.fit(train_X, train_y)
 
-    # Step 7: Save the trained model
+    # Step 6: Save the trained model
     PhisherCop(preprocessor, model).save(MODEL_TYPE.default_path)
     print(f"Saved trained model to {MODEL_TYPE.default_path}")
 
-    # Step 8: Evaluate model performance
+    # Step 7: Evaluate model performance
     y_pred = model.predict(test_X)
     print(f"Train accuracy: {model.score(train_X, train_y):.3f}")
     print(f"Test accuracy: {model.score(test_X, test_y):.3f}")
@@ -7,13 +7,19 @@ receive a phishing detection score. The web application allows users to:
 2. Select which model type to use for analysis (SVM or Random Forest)
 3. View the phishing detection score with results
 
+Several emails can also be scored at once by POSTing JSON to the /batch
+endpoint, which returns the scores as JSON instead of a rendered page.
+
 The web interface is built using Flask and can be accessed at http://localhost:5000
 when running the development server.
 """
 
-from flask import Flask, render_template, request
+import os
+from functools import lru_cache
+
+from flask import Flask, jsonify, render_template, request
 
-from lib.email import email_from_input
+from lib.email import PreprocessedEmail, email_from_input, preprocess_email
 from lib.model import ModelType, PhisherCop
 
 # Initialize Flask application
@@ -26,6 +32,131 @@ all_model_types = [
     (model_type.value, model_type.name.replace("_", " ").title())
     for model_type in ModelType
 ]
+# Look up submitted model types with a plain dict instead of calling ModelType(value)
+model_types_by_value = {model_type.value: model_type for model_type in ModelType}
+# The most emails a single /batch request may score
+MAX_BATCH_SIZE = 100
+
+
+@app.context_processor
+def inject_model_types() -> dict[str, list[tuple[str, str]]]:
+    """
+    Make the model types for the dropdown available to every rendered template.
+
+    Returns:
+        Template context containing the list of (value, display name) model types
+    """
+    return {"model_types": all_model_types}
+
+
+@lru_cache(maxsize=len(ModelType))
+def load_model(model_type: ModelType, model_mtime_ns: int) -> PhisherCop:
+    """
+    Load the model of the given type, once per process.
+
+    Unpickling a model takes far longer than scoring an email with it, so each
+    model is only loaded the first time it is needed. The modification time of
+    the model file is part of the cache key, so a retrained model is reloaded.
+
+    Args:
+        model_type: The type of model to load
+        model_mtime_ns: Modification time of the model file, in nanoseconds
+
+    Returns:
+        PhisherCop: The loaded model, shared by all requests
+    """
+    return PhisherCop.load(model_type.default_path)
+
+
+@lru_cache(maxsize=512)
+def preprocess_input(
+    sender: str,
+    subject: str,
+    payload: str,
+    cc: str,
+) -> PreprocessedEmail:
+    """
+    Preprocess the email submitted through the web form.
+
+    Preprocessing does not depend on the selected model, so the result is cached
+    separately from the scores. Scoring the same email with another model then
+    skips parsing the email and its HTML again.
+
+    Args:
+        sender: The sender's email address
+        subject: The email subject line
+        payload: The email body content (HTML or plain text)
+        cc: The CC field content (can be empty)
+
+    Returns:
+        PreprocessedEmail: The preprocessed email, which must not be modified
+    """
+    email = email_from_input(sender, subject, payload, cc)
+    return preprocess_email(email, ignore_errors=False)
+
+
+@lru_cache(maxsize=1024)
+def score_input(
+    model_type: ModelType,
+    model_mtime_ns: int,
+    sender: str,
+    subject: str,
+    payload: str,
+    cc: str,
+) -> float:
+    """
+    Score the email submitted through the web form with the selected model.
+
+    Results are cached, so resubmitting the same form skips parsing and scoring
+    the email again. The modification time of the model file is part of the
+    cache key, so retraining a model invalidates its cached scores.
+
+    Args:
+        model_type: The type of model to score the email with
+        model_mtime_ns: Modification time of the model file, in nanoseconds
+        sender: The sender's email address
+        subject: The email subject line
+        payload: The email body content (HTML or plain text)
+        cc: The CC field content (can be empty)
+
+    Returns:
+        float: Phishing score between 0.0 and 1.0
+    """
+    model = load_model(model_type, model_mtime_ns)
+    email = preprocess_input(sender, subject, payload, cc)
+    return model.score_preprocessed_email(email)
+
+
+def get_model_mtime_ns(model_type: ModelType) -> int:
+    """
+    Get the modification time of the model file, used to invalidate cached scores.
+
+    Args:
+        model_type: The type of model to look up
+
+    Returns:
+        int: Modification time of the model file, in nanoseconds
+    """
+    return os.stat(model_type.default_path).st_mtime_ns
+
+
+def parse_model_type(value: str) -> ModelType:
+    """
+    Look up the model type submitted by the user.
+
+    Args:
+        value: The submitted model type value
+
+    Returns:
+        ModelType: The matching model type
+
+    Raises:
+        ValueError: If the model type is not supported
+    """
+    model_type = model_types_by_value.get(value)
+    if model_type is None:
+        raise ValueError(f"Unsupported model type: {value}")
+    return model_type
 
 
 @app.route("/", methods=["GET", "POST"])
@@ -48,7 +179,7 @@ def index():
     match request.method:
         case "GET":
             # Simply render the form
-            return render_template(template, model_types=all_model_types)
+            return render_template(template)
         case "POST":
             # Extract form data
             sender = request.form.get("sender", "")
@@ -59,28 +190,71 @@ def index():
 
             try:
                 # Load the selected model and process the email
-                model_type = ModelType(model_type_value)
-                model = PhisherCop.load(model_type.default_path)
-                email = email_from_input(sender, subject, payload, cc)
-                score = model.score_email(email)
+                model_type = parse_model_type(model_type_value)
+                score = score_input(
+                    model_type,
+                    get_model_mtime_ns(model_type),
+                    sender,
+                    subject,
+                    payload,
+                    cc,
+                )
             except Exception as e:
                 # Return error message if processing fails
-                return render_template(
-                    template,
-                    errors=[f"Error: {e}"],
-                    model_types=all_model_types,
-                )
+                return render_template(template, errors=[f"Error: {e}"])
 
             # Return the results
-            return render_template(
-                template,
-                result=score * 100,
-                model_types=all_model_types,
-            )
+            return render_template(template, result=score * 100)
         case _:
             # Handle unsupported HTTP methods
             raise ValueError(f"Unsupported method: {request.method}")
 
 
+@app.route("/batch", methods=["POST"])
+def batch():
+    """
+    Score several emails with one model in a single request.
+
+    Expects a JSON body of the form:
+    {"model_type": "svm", "emails": [{"sender": ..., "subject": ..., "payload": ..., "cc": ...}]}
+
+    All emails are scored together, so the preprocessor and model are only
+    called once instead of once per email. The emails are preprocessed without
+    the `preprocess_input` cache, so a large batch doesn't evict the emails
+    cached for the web form.
+
+    Returns:
+        JSON with a "scores" list in the same order as the emails, or an
+        "error" message with status 400 if the request could not be processed
+        or has more than `MAX_BATCH_SIZE` emails
+    """
+    try:
+        body = request.get_json(force=True)
+        model_type = parse_model_type(body.get("model_type", ""))
+        raw_emails = body.get("emails", [])
+        if not raw_emails:
+            raise ValueError("No emails to score")
+        if len(raw_emails) > MAX_BATCH_SIZE:
+            raise ValueError(f"Too many emails to score, the limit is {MAX_BATCH_SIZE}")
+        emails = [
+            preprocess_email(
+                email_from_input(
+                    email.get("sender", ""),
+                    email.get("subject", ""),
+                    email.get("payload", ""),
+                    email.get("cc", ""),
+                ),
+                ignore_errors=False,
+            )
+            for email in raw_emails
+        ]
+        model = load_model(model_type, get_model_mtime_ns(model_type))
+        scores = model.score_preprocessed_emails(emails)
+    except Exception as e:
+        return jsonify(error=f"Error: {e}"), 400
+
+    return jsonify(scores=scores.tolist())
+
+
 if __name__ == "__main__":
     app.run(debug=True)
@@ -1,6 +1,6 @@
 import unittest
 
-from src.lib import parallelize
+from src.lib import parallelize, parallelize_iter
 
 # Use redundant import names to make the linter happy
 from .bktree import TestBKTree as TestBKTree
@@ -22,3 +22,9 @@ class TestParallelize(unittest.TestCase):
         expected = list(map(addTwo, input))
         actual = parallelize(addTwo, input)
         self.assertEqual(expected, actual)
+
+    def test_parallelize_iter(self):
+        input = [1, 2, 3, 4, 5]
+        expected = list(map(addTwo, input))
+        actual = list(parallelize_iter(addTwo, input))
+        self.assertEqual(expected, actual)
@@ -16,6 +16,9 @@ class TestLevenshteinDistance(unittest.TestCase):
         self.assertEqual(levenshtein_distance("abc", "axc"), 1)
         self.assertEqual(levenshtein_distance("abc", "xbc"), 1)
         self.assertEqual(levenshtein_distance("abc", "xyz"), 3)
+        self.assertEqual(levenshtein_distance("goggle.com", "google.com"), 1)
+        self.assertEqual(levenshtein_distance("aaa", "aaaa"), 1)
+        self.assertEqual(levenshtein_distance("abcabc", "abc"), 3)
 
 
 class TestBKTree(unittest.TestCase):
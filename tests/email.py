@@ -10,6 +10,7 @@ from src.lib.email import (
     PreprocessedEmail,
     email_from_file,
     email_from_input,
+    email_headers_from_file,
     get_email_addresses,
     payload_dom,
     preprocess_email,
@@ -21,6 +22,21 @@ from src.lib.email_address import parse_email_address
 
 
 class TestEmail(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Share one temporary directory, each test writes its own file into it
+        cls.tmpdir = TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def write_email(self, filename, content):
+        filepath = os.path.join(self.tmpdir.name, filename)
+        with open(filepath, "w") as f:
+            f.write(content)
+        return filepath
+
     def test_preprocess_email(self):
         expected = PreprocessedEmail(
             urls=set(),
@@ -76,24 +92,43 @@ class TestEmail(unittest.TestCase):
             "\r\n"
             "--- Original message ---\r\n"
         )
-        with TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test_mail.txt")
-            with open(filepath, "w") as f:
-                f.write(
-                    f"From: {expected_from}\r\n"
-                    f"To: recipient@example.com\r\n"
-                    f"Content-Type: {expected_content_type}; charset={expected_charset}\r\n"
-                    f"Subject: {expected_subject}\r\n"
-                    "\r\n"
-                    f"{expected_payload}"
-                )
-            email = email_from_file(filepath)
+        filepath = self.write_email(
+            "from_file.txt",
+            f"From: {expected_from}\r\n"
+            f"To: recipient@example.com\r\n"
+            f"Content-Type: {expected_content_type}; charset={expected_charset}\r\n"
+            f"Subject: {expected_subject}\r\n"
+            "\r\n"
+            f"{expected_payload}",
+        )
+        email = email_from_file(filepath)
         self.assertEqual(email["From"], expected_from)
         self.assertEqual(email.get_content_type(), expected_content_type)
         self.assertEqual(email.get_content_charset(), expected_charset)
         self.assertEqual(email["Subject"], expected_subject)
         self.assertEqual(email.get_payload(), expected_payload)
 
+    def test_email_headers_from_file(self):
+        filepath = self.write_email(
+            "headers_from_file.txt",
+            "From: Mail Delivery Subsystem <postmaster@example.com>\r\n"
+            "Cc: someone@gov.com,\r\n"
+            " not-scammer@phishi.ng\r\n"
+            "Subject: Undelivered Mail Returned to Sender\r\n"
+            "\r\n"
+            "From: not-a-header@example.com\r\n",
+        )
+        email = email_headers_from_file(filepath)
+        self.assertEqual(email["Subject"], "Undelivered Mail Returned to Sender")
+        self.assertEqual(email.get_payload(), "")
+        expected = [
+            parse_email_address("postmaster@example.com"),
+            parse_email_address("someone@gov.com"),
+            parse_email_address("not-scammer@phishi.ng"),
+        ]
+        actual = get_email_addresses(email, False)
+        self.assertListEqual(actual, expected)
+
     def test_email_from_input(self):
         with self.assertRaises(ValueError):
             email_from_input(
@@ -118,42 +153,40 @@ class TestEmail(unittest.TestCase):
             "  </body>\r\n"
             "</html>\r\n"
         )
-        with TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test_mail.txt")
-            with open(filepath, "w") as f:
-                f.write(
-                    "From: Mail Delivery Subsystem <postmaster@example.com>\r\n"
-                    "To: recipient@example.com\r\n"
-                    "Subject: Undelivered Mail Returned to Sender\r\n"
-                    'Content-Type: multipart/mixed; boundary="boundary-123"\r\n'
-                    "\r\n"
-                    "--boundary-123\r\n"
-                    'Content-Type: multipart/alternative; boundary="boundary-456"\r\n'
-                    "\r\n"
-                    "--boundary-456\r\n"
-                    "Content-Type: text/plain; charset=chinesebig5\r\n"
-                    "Content-Transfer-Encoding: quoted-printable\r\n"
-                    "\r\n"
-                    f"{quopri.encodestring(expected_payload_plain.encode('big5')).decode('big5')}"
-                    "\r\n"
-                    "--boundary-456\r\n"
-                    "Content-Type: text/html; charset=utf-8\r\n"
-                    "Content-Transfer-Encoding: base64\r\n"
-                    "\r\n"
-                    f"{b64encode(expected_payload_html.encode('utf-8')).decode('utf-8')}"
-                    "\r\n"
-                    "--boundary-456--\r\n"
-                    "\r\n"
-                    "--boundary-123\r\n"
-                    'Content-Type: application/octet-stream; name="attachment.txt"\r\n'
-                    "Content-Transfer-Encoding: base64\r\n"
-                    'Content-Disposition: attachment; filename="attachment.txt"\r\n'
-                    "\r\n"
-                    f"{b64encode(b'This is an attachment.').decode('utf-8')}"
-                    "\r\n"
-                    "--boundary-123--\r\n"
-                )
-            email = email_from_file(filepath)
+        filepath = self.write_email(
+            "raw_payload.txt",
+            "From: Mail Delivery Subsystem <postmaster@example.com>\r\n"
+            "To: recipient@example.com\r\n"
+            "Subject: Undelivered Mail Returned to Sender\r\n"
+            'Content-Type: multipart/mixed; boundary="boundary-123"\r\n'
+            "\r\n"
+            "--boundary-123\r\n"
+            'Content-Type: multipart/alternative; boundary="boundary-456"\r\n'
+            "\r\n"
+            "--boundary-456\r\n"
+            "Content-Type: text/plain; charset=chinesebig5\r\n"
+            "Content-Transfer-Encoding: quoted-printable\r\n"
+            "\r\n"
+            f"{quopri.encodestring(expected_payload_plain.encode('big5')).decode('big5')}"
+            "\r\n"
+            "--boundary-456\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            "Content-Transfer-Encoding: base64\r\n"
+            "\r\n"
+            f"{b64encode(expected_payload_html.encode('utf-8')).decode('utf-8')}"
+            "\r\n"
+            "--boundary-456--\r\n"
+            "\r\n"
+            "--boundary-123\r\n"
+            'Content-Type: application/octet-stream; name="attachment.txt"\r\n'
+            "Content-Transfer-Encoding: base64\r\n"
+            'Content-Disposition: attachment; filename="attachment.txt"\r\n'
+            "\r\n"
+            f"{b64encode(b'This is an attachment.').decode('utf-8')}"
+            "\r\n"
+            "--boundary-123--\r\n",
+        )
+        email = email_from_file(filepath)
         self.assertEqual(
             raw_payload(email), f"{expected_payload_plain}\n{expected_payload_html}"
         )
@@ -161,24 +194,22 @@ class TestEmail(unittest.TestCase):
         self.assertEqual(raw_payload(Email()), "")
 
     def test_payload_dom(self):
-        with TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test_mail.txt")
-            with open(filepath, "w") as f:
-                f.write(
-                    "From: Mail Delivery Subsystem <postmaster@example.com>\r\n"
-                    "To: recipient@example.com\r\n"
-                    "Subject: Undelivered Mail Returned to Sender\r\n"
-                    "content-type: text/html; charset=utf-8\r\n"
-                    "\r\n"
-                    "<html>\r\n"
-                    "    <body>\r\n"
-                    "        <h1>Hello World!</h1>\r\n"
-                    "        <p>This is a test.</p>\r\n"
-                    "        <a href='http://example.com'>Example</a>\r\n"
-                    "    </body>\r\n"
-                    "</html>\r\n"
-                )
-            email = email_from_file(filepath)
+        filepath = self.write_email(
+            "payload_dom.txt",
+            "From: Mail Delivery Subsystem <postmaster@example.com>\r\n"
+            "To: recipient@example.com\r\n"
+            "Subject: Undelivered Mail Returned to Sender\r\n"
+            "content-type: text/html; charset=utf-8\r\n"
+            "\r\n"
+            "<html>\r\n"
+            "    <body>\r\n"
+            "        <h1>Hello World!</h1>\r\n"
+            "        <p>This is a test.</p>\r\n"
+            "        <a href='http://example.com'>Example</a>\r\n"
+            "    </body>\r\n"
+            "</html>\r\n",
+        )
+        email = email_from_file(filepath)
         expected = (
             "<html>\n"
             " <body>\n"
@@ -251,23 +282,21 @@ class TestEmail(unittest.TestCase):
         self.assertListEqual(actual_tokens, expected_tokens)
 
     def test_words_from_tokens(self):
-        with TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test_mail.txt")
-            with open(filepath, "w") as f:
-                f.write(
-                    "From: Mail Delivery Subsystem <postmaster@example.com>\r\n"
-                    "To: recipient@example.com\r\n"
-                    "Subject: Undelivered Mail Returned to Sender\r\n"
-                    "content-type: text/html; charset=utf-8\r\n"
-                    "\r\n"
-                    "<html>\r\n"
-                    "    <body>\r\n"
-                    "        <p>Hello,   I am under the-water</p>\r\n"
-                    "        <a href='http://defo.scam.com'>https://not.scam.com <- click me!</a>\r\n"
-                    "    </body>\r\n"
-                    "</html>\r\n"
-                )
-            email = email_from_file(filepath)
+        filepath = self.write_email(
+            "words_from_tokens.txt",
+            "From: Mail Delivery Subsystem <postmaster@example.com>\r\n"
+            "To: recipient@example.com\r\n"
+            "Subject: Undelivered Mail Returned to Sender\r\n"
+            "content-type: text/html; charset=utf-8\r\n"
+            "\r\n"
+            "<html>\r\n"
+            "    <body>\r\n"
+            "        <p>Hello,   I am under the-water</p>\r\n"
+            "        <a href='http://defo.scam.com'>https://not.scam.com <- click me!</a>\r\n"
+            "    </body>\r\n"
+            "</html>\r\n",
+        )
+        email = email_from_file(filepath)
 
         urls, tokens = tokenize_payload(email)
         words = words_from_tokens(tokens)
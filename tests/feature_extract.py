@@ -24,6 +24,14 @@ def test_kernel(x: float) -> float:
 
 
 class TestFeatureExtract(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Building a BK-tree computes many distances, so only build them once
+        cls.tree = BKTree(
+            levenshtein_distance, ["example.com", "test.com", "sample.org"]
+        )
+        cls.empty_tree = BKTree(levenshtein_distance, [])
+
     def test_count_whitelisted_addresses(self):
         count = count_whitelisted_addresses(
             [
@@ -92,15 +100,13 @@ class TestFeatureExtract(unittest.TestCase):
         )
 
     def test_is_typosquatted_domain(self):
-        tree = BKTree(levenshtein_distance, ["example.com", "test.com", "sample.org"])
-
-        self.assertTrue(is_typosquatted_domain("examble.com", tree, 1))
-        self.assertTrue(is_typosquatted_domain("test.co", tree, 1))
-        self.assertTrue(is_typosquatted_domain("snple.org", tree, 2))
+        self.assertTrue(is_typosquatted_domain("examble.com", self.tree, 1))
+        self.assertTrue(is_typosquatted_domain("test.co", self.tree, 1))
+        self.assertTrue(is_typosquatted_domain("snple.org", self.tree, 2))
 
-        self.assertFalse(is_typosquatted_domain("snpe.org", tree, 2))
-        self.assertFalse(is_typosquatted_domain("facebook.com", tree, 3))
-        self.assertFalse(is_typosquatted_domain("example.com", tree, 3))
+        self.assertFalse(is_typosquatted_domain("snpe.org", self.tree, 2))
+        self.assertFalse(is_typosquatted_domain("facebook.com", self.tree, 3))
+        self.assertFalse(is_typosquatted_domain("example.com", self.tree, 3))
 
         self.assertEqual(
             count_typosquatted_domains(
@@ -113,28 +119,31 @@ class TestFeatureExtract(unittest.TestCase):
                         urlparse("https://ex4mple.com"),
                     }
                 ),
-                tree,
+                self.tree,
                 1,
             ),
             2,
         )
-        self.assertEqual(count_typosquatted_domains([], tree, 1), 0)
+        self.assertEqual(count_typosquatted_domains([], self.tree, 1), 0)
 
-        tree = BKTree(levenshtein_distance, [])
-        self.assertFalse(is_typosquatted_domain("anything.com", tree, 100))
-        self.assertFalse(is_typosquatted_domain("", tree, 1))
+        self.assertFalse(is_typosquatted_domain("anything.com", self.empty_tree, 100))
+        self.assertFalse(is_typosquatted_domain("", self.empty_tree, 1))
 
     def test_is_ip_address(self):
         self.assertTrue(is_ip_address(urlparse("http://1.1.1.1")))
         self.assertTrue(is_ip_address(urlparse("http://1.2.3.4/abc/e?q=1#frag")))
         self.assertTrue(is_ip_address(urlparse("http://[::]/abc/e?q=1#frag")))
         self.assertTrue(is_ip_address(urlparse("https://[::1]/abc/e?q=1#frag")))
+        self.assertTrue(is_ip_address(urlparse("http://[::ffff:1.2.3.4]")))
+        self.assertTrue(is_ip_address(urlparse("http://[fe80::1%25eth0]")))
 
         self.assertFalse(is_ip_address(urlparse("")))
         self.assertFalse(is_ip_address(urlparse("https://c.d.uk.edu")))
         self.assertFalse(is_ip_address(urlparse("https://a.b.com/abc/e?q=1#frag")))
         self.assertFalse(is_ip_address(urlparse("https://1.1.1.1.edu")))
         self.assertFalse(is_ip_address(urlparse("https://test.com/1.1.1.1")))
+        self.assertFalse(is_ip_address(urlparse("http://01.1.1.1")))
+        self.assertFalse(is_ip_address(urlparse("http://256.1.1.1")))
 
         self.assertEqual(
             count_ip_addresses(